@@ -198,3 +198,76 @@ class Query:
                     return_dict[str(page["title"])] = []
 
             return return_dict
+
+    def get_revisions(self, page: str, content: bool = False, limit: int = 0) -> List[Dict[str, Any]]:
+        """Fetches the revision history of the given page, oldest first
+
+        Follows API continuation until every revision has been fetched.
+        If limit is set, only the limit most recent revisions are fetched (still returned oldest first).
+
+        Args:
+            page (str): the page name
+            content (bool): whether to include the content of each revision (default: False)
+            limit (int): the number of most recent revisions to fetch, 0 for all (default: 0)
+
+        Returns:
+            A list of dicts containing {revision id (int), parent id (int), page id (int), page name (str), timestamp (str), size (int), user (str)},
+            plus content (str) if content is True. An empty list if the page doesn't exist
+        """
+
+        r_params = {
+            "action": "query",
+            "prop": "revisions",
+            "titles": page,
+            "rvprop": "ids|timestamp|size|user",
+            "rvlimit": "max",
+            "rvdir": "older" if limit > 0 else "newer",
+            "format": "json",
+            "redirects": "true"
+        }
+
+        if content:
+            r_params["rvprop"] += "|content"
+            r_params["rvslots"] = "main"
+
+        revisions = []
+        while True:
+            if limit > 0:
+                r_params["rvlimit"] = str(limit - len(revisions))
+
+            r_json = self.wiki.session.post(config.api_url, data=r_params).json()
+
+            id_key = list(r_json["query"]["pages"])[0]
+            if id_key[0] == "-":
+                return []
+
+            page_json = r_json["query"]["pages"][id_key]
+            for r in page_json.get("revisions", []):
+                revision = {
+                    "revid": int(r["revid"]),
+                    "parentid": int(r.get("parentid", 0)),
+                    "pageid": int(page_json["pageid"]),
+                    "title": str(page_json["title"]),
+                    "timestamp": str(r["timestamp"]),
+                    "size": int(r.get("size", -1)),
+                    "user": str(r.get("user", ""))
+                }
+
+                if content:
+                    revision["content"] = str(r.get("slots", {}).get("main", {}).get("*", ""))
+
+                revisions.append(revision)
+
+                if 0 < limit <= len(revisions):
+                    break
+
+            if 0 < limit <= len(revisions) or "continue" not in r_json:
+                break
+
+            r_params.update(r_json["continue"])
+
+        # A limited fetch walks back from the newest revision, so put it back in oldest first order
+        if limit > 0:
+            revisions.reverse()
+
+        return revisions
@@ -0,0 +1,206 @@
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.atomic_utils import write_json_atomic
+
+
+class CrawlJob:
+    """CrawlJob class
+
+    Runs a crawl over a list of page names in chunks. Every finished chunk is appended
+    to a journal, and the pending page names are checkpointed to a small checkpoint file.
+    If the job is interrupted, running it again with the same page names
+    resumes from the journal instead of starting over. Once the output is written,
+    the checkpoint is marked as done, so running it again skips the crawl entirely.
+
+    Attributes:
+        pages (List[str]): the page names to crawl
+        output_file (str): the file the results are written to
+        checkpoint_file (str): the json file the pending page names are checkpointed to
+        journal_file (str): the json lines file finished chunks are appended to
+        chunk_size (int): the number of page names fetched at a time
+        checkpoint_every (int): the number of chunks between checkpoints
+        write_output (Callable[[str, Dict[str, Any]], None]): writes the finished results to output_file
+        job_key (Any): json serializable fetch parameters, a checkpoint for different ones is discarded
+        results (Dict[str, Any]): a dict mapping a page name (key), to its fetched data (value)
+        pending (List[str]): the page names that haven't been fetched yet
+        done (bool): whether output_file was written for these page names
+    """
+
+    def __init__(self, pages: List[str], output_file: str, chunk_size: int = 50, checkpoint_every: int = 1, checkpoint_file: Optional[str] = None,
+                 write_output: Optional[Callable[[str, Dict[str, Any]], None]] = None, job_key: Any = None) -> None:
+        """Inits a CrawlJob
+
+        Args:
+            pages (List[str]): the page names to crawl
+            output_file (str): the file the results are written to
+            chunk_size (int): the number of page names fetched at a time (default: 50)
+            checkpoint_every (int): the number of chunks between checkpoints (default: 1)
+            checkpoint_file (str): the checkpoint file (default: output_file + ".checkpoint")
+            write_output (Callable[[str, Dict[str, Any]], None]): takes output_file and the results,
+                and writes them atomically (default: write_json_atomic)
+            job_key (Any): json serializable fetch parameters, a checkpoint for different ones is discarded (default: None)
+        """
+
+        self.pages = list(pages)
+        self.output_file = output_file
+        self.checkpoint_file = checkpoint_file if checkpoint_file is not None else output_file + ".checkpoint"
+        self.journal_file = self.checkpoint_file + ".journal"
+        self.chunk_size = max(1, chunk_size)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.write_output = write_output if write_output is not None else write_json_atomic
+        self.job_key = job_key
+
+        self.results: Dict[str, Any] = {}
+        self.pending: List[str] = list(self.pages)
+        self.done: bool = False
+
+    def load_checkpoint(self) -> bool:
+        """Restores pending page names from the checkpoint file and results from the journal
+
+        A checkpoint is only used if it was written for the same page names, output file and job key.
+        Journal lines that can't be read (e.g. cut off by a crash) are skipped, so their chunks are fetched again.
+
+        Returns:
+            True if a checkpoint was restored, False otherwise
+        """
+
+        if not os.path.isfile(self.checkpoint_file):
+            return False
+
+        try:
+            with open(self.checkpoint_file, "r") as f:
+                checkpoint = json.loads(f.read())
+
+            if checkpoint["pages"] != self.pages or checkpoint["output_file"] != self.output_file \
+                    or checkpoint["job_key"] != json.loads(json.dumps(self.job_key)):
+                return False
+
+            pending = [str(l) for l in checkpoint["pending"]]
+            done = bool(checkpoint.get("done", False))
+        except (ValueError, KeyError, TypeError):
+            return False
+
+        if done:
+            self.results = {}
+            self.pending = []
+            self.done = True
+            return True
+
+        results = {}
+        fetched = set()
+        if os.path.isfile(self.journal_file):
+            with open(self.journal_file, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        chunk = [str(l) for l in entry["chunk"]]
+                        results.update(entry["results"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+                    fetched.update(chunk)
+
+        self.results = results
+        self.pending = [l for l in pending if l not in fetched]
+        self.done = False
+        return True
+
+    def save_checkpoint(self) -> None:
+        """Atomically writes the pending page names (or that the job is done) to the checkpoint file"""
+
+        write_json_atomic(self.checkpoint_file, {
+            "output_file": self.output_file,
+            "job_key": self.job_key,
+            "pages": self.pages,
+            "pending": self.pending,
+            "done": self.done
+        })
+
+    def clear_checkpoint(self) -> None:
+        """Removes the checkpoint and journal files if they exist"""
+
+        for file in [self.checkpoint_file, self.journal_file]:
+            if os.path.isfile(file):
+                os.remove(file)
+
+    def run(self, fetch_chunk: Callable[[List[str]], Dict[str, Any]], verbose: bool = False, restart: bool = False) -> None:
+        """Fetches every pending page name and writes the results to output_file
+
+        Each finished chunk is appended to the journal. The journal is synced to disk and the
+        checkpoint is saved every checkpoint_every chunks, and again when fetching stops for any reason,
+        so a later run only fetches the page names that are still pending (and a failed write_output
+        only needs the write retried). Once output_file is written, the journal is removed and the checkpoint
+        is marked as done. Later runs for the same page names skip the crawl while output_file exists.
+
+        Args:
+            fetch_chunk (Callable[[List[str]], Dict[str, Any]]): takes a chunk of page names and
+                returns a dict mapping each page name (key), to its data (value)
+            verbose (bool): whether to print progress (default: False)
+            restart (bool): whether to ignore the checkpoint and fetch every page name again (default: False)
+
+        Returns:
+            Nothing
+        """
+
+        resumed = not restart and self.load_checkpoint()
+        if resumed and self.done:
+            if os.path.isfile(self.output_file):
+                if verbose:
+                    print("Skipping " + self.output_file + ", it is already up to date")
+                return
+
+            resumed = False
+
+        if resumed:
+            if verbose:
+                print("Resuming " + self.output_file + " with " + str(len(self.pending)) + " of " + str(len(self.pages)) + " pages left")
+        else:
+            self.clear_checkpoint()
+            self.results = {}
+            self.pending = list(self.pages)
+            self.done = False
+            self.save_checkpoint()
+
+        with open(self.journal_file, "a") as journal:
+            def sync() -> None:
+                journal.flush()
+                os.fsync(journal.fileno())
+                self.save_checkpoint()
+
+            # Start on a new line in case the last run was cut off mid-line
+            journal.write("\n")
+
+            chunks_done = 0
+            try:
+                while self.pending:
+                    chunk = self.pending[:self.chunk_size]
+                    if verbose:
+                        for l in chunk:
+                            print("Adding " + l + " to " + self.output_file)
+
+                    chunk_results = fetch_chunk(chunk)
+                    journal.write(json.dumps({"chunk": chunk, "results": chunk_results}) + "\n")
+
+                    self.results.update(chunk_results)
+                    self.pending = self.pending[len(chunk):]
+
+                    chunks_done += 1
+                    if chunks_done % self.checkpoint_every == 0:
+                        sync()
+            except BaseException:
+                # Don't let a failed sync (e.g. a full disk) hide the original error
+                try:
+                    sync()
+                except Exception as e:
+                    print("Failed to checkpoint " + self.output_file + ": " + str(e))
+                raise
+
+            sync()
+
+        self.write_output(self.output_file, self.results)
+
+        self.done = True
+        self.save_checkpoint()
+        os.remove(self.journal_file)
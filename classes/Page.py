@@ -26,6 +26,7 @@ class Page:
         """
         self.title = title
 
+        # Same as file_utils.get_simple_title, which can't be imported here since file_utils imports Page
         if "Mod:" in self.title:
             if "/" in self.title:
                 t_split = self.title.split("/")
@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+from typing import Any, Callable, IO
+
+
+def atomic_write(file: str, mode: str, write_fn: Callable[[IO], None]) -> None:
+    """Writes file without ever leaving a partially written file behind
+
+    write_fn writes to a temporary file in the same directory, which then replaces file.
+    The replaced file keeps the permissions of the existing file, or the umask default for a new file.
+
+    Args:
+        file (str): the name of the file
+        mode (str): the mode to open the temporary file with ("w" or "wb")
+        write_fn (Callable[[IO], None]): takes the open temporary file and writes to it
+
+    Returns:
+        Nothing
+    """
+
+    if os.path.exists(file):
+        file_mode = os.stat(file).st_mode & 0o777
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        file_mode = 0o666 & ~umask
+
+    directory = os.path.dirname(os.path.abspath(file))
+    fd, tmp_file = tempfile.mkstemp(dir=directory, prefix=os.path.basename(file) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write_fn(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_file, file_mode)
+        os.replace(tmp_file, file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def write_json_atomic(json_file: str, data: Any) -> None:
+    """Atomically writes data to json_file
+
+    Args:
+        json_file (str): the name of a json file
+        data (Any): the data to write
+
+    Returns:
+        Nothing
+    """
+
+    atomic_write(json_file, "w", lambda f: f.write(json.dumps(data)))
@@ -1,7 +1,8 @@
 import json
-from typing import List, Dict
+from typing import List, Dict, Any
 
 from actions.ARKWiki import ARKWiki
+from classes.CrawlJob import CrawlJob
 from classes.ManualPage import ManualPage
 from classes.Page import Page
 
@@ -38,105 +39,107 @@ def get_pages_string(pages: List[str]) -> str:
     return pages_string[:-1]
 
 
-def create_pages_json(pages: List[str], wiki: ARKWiki, verbose: bool = True) -> None:
+def get_simple_title(page: str) -> str:
+    """Simplifies a page name for when it is in the Mod: namespace
+
+    Args:
+        page (str): a page name
+
+    Returns:
+        The page name without the Mod: prefix (and mod name, if it is a subpage)
+    """
+
+    if "Mod:" in page:
+        if "/" in page:
+            return page.split("/")[1]
+        else:
+            return page.replace("Mod:", "")
+    else:
+        return page
+
+
+def create_pages_json(pages: List[str], wiki: ARKWiki, verbose: bool = True, checkpoint_every: int = 10, restart: bool = False) -> None:
     """Creates (or overwrites) json/pages.json.
 
     Populated with data from the page names in 'pages'
     Fetches data by querying each individual page.
+    Progress is checkpointed to json/pages.json.checkpoint, so an interrupted run resumes where it left off,
+    and a finished run for the same page names is skipped.
 
     Args:
         pages (List[str]): a list of page names
         wiki (ARKWiki): the ARKWiki object
         verbose (bool): whether to print page names (default: True)
+        checkpoint_every (int): the number of pages between checkpoints (default: 10)
+        restart (bool): whether to ignore the checkpoint and fetch every page again (default: False)
 
     Returns:
         Nothing
     """
 
-    with open("json/pages.json", "w+") as f:
-        f.write("{}")
-
-    for l in pages:
-        if verbose:
-            print("Adding " + l + " to pages.json")
-
-        p = Page(l, wiki)
+    def fetch_chunk(c: List[str]) -> Dict[str, Any]:
+        pages_json = {}
+        for l in c:
+            p = Page(l, wiki)
 
-        with open("json/pages.json", "r") as f:
-            pages_json = json.loads(f.read())
             pages_json[l] = {}
             pages_json[l]["title"] = p.title
-
-            if "Mod:" in l:
-                if "/" in l:
-                    t_split = l.split("/")
-                    pages_json[l]["simple_title"] = t_split[1]
-                else:
-                    pages_json[l]["simple_title"] = l.replace("Mod:", "")
-            else:
-                pages_json[l]["simple_title"] = l
-
+            pages_json[l]["simple_title"] = get_simple_title(l)
             pages_json[l]["info"] = p.info
             pages_json[l]["categories"] = p.categories
             pages_json[l]["content"] = p.content
 
-        with open("json/pages.json", "w") as f:
-            f.write(json.dumps(pages_json))
+        return pages_json
+
+    job = CrawlJob(pages, "json/pages.json", chunk_size=1, checkpoint_every=checkpoint_every)
+    job.run(fetch_chunk, verbose, restart)
 
 
-def create_pages_fast_json(pages: List[str], wiki: ARKWiki) -> None:
+def create_pages_fast_json(pages: List[str], wiki: ARKWiki, verbose: bool = False, restart: bool = False) -> None:
     """Creates (or overwrites) json/pages_fast.json
 
     Populated with data from the page names in 'pages'.
     Fetches data much quicker by querying the API in chunks of 50 instead of every individual page.
+    Progress is checkpointed to json/pages_fast.json.checkpoint after every chunk, so an interrupted run resumes where it left off,
+    and a finished run for the same page names is skipped.
     Don't use the ManualPage.categories variable when loading from fast_json (doesn't work correctly).
 
     Args:
         pages (List[str]): a list of page names
         wiki (ARKWiki): the ARKWiki object
+        verbose (bool): whether to print page names (default: False)
+        restart (bool): whether to ignore the checkpoint and fetch every page again (default: False)
 
     Returns:
         Nothing
     """
 
-    lines_chunks = list(chunks(pages, 50))
-
-    with open("json/pages_fast.json", "w+") as f:
-        f.write("{}")
-
-    all_info = {}
-    all_categories = {}
-    all_content = {}
-
-    for c in lines_chunks:
+    def fetch_chunk(c: List[str]) -> Dict[str, Any]:
         ts = get_pages_string(c)
 
-        all_info.update(wiki.query.get_info(ts))
-        all_categories.update(wiki.query.get_categories(ts))
-        all_content.update(wiki.query.get_content(ts))
+        all_info = wiki.query.get_info(ts)
+        all_categories = wiki.query.get_categories(ts)
+        all_content = wiki.query.get_content(ts)
 
-    for l in pages:
-        with open("json/pages_fast.json", "r") as f:
-            pages_json = json.loads(f.read())
+        # A single page name returns a single page's data instead of a dict
+        if len(c) == 1:
+            all_info = {c[0]: all_info}
+            all_categories = {c[0]: all_categories}
+            all_content = {c[0]: all_content}
 
+        pages_json = {}
+        for l in c:
             pages_json[l] = {}
             pages_json[l]["title"] = l
-
-            if "Mod:" in l:
-                if "/" in l:
-                    t_split = l.split("/")
-                    pages_json[l]["simple_title"] = t_split[1]
-                else:
-                    pages_json[l]["simple_title"] = l.replace("Mod:", "")
-            else:
-                pages_json[l]["simple_title"] = l
-
+            pages_json[l]["simple_title"] = get_simple_title(l)
             pages_json[l]["info"] = all_info[l]
             pages_json[l]["categories"] = all_categories[l]
             pages_json[l]["content"] = all_content[l]
 
-        with open("json/pages_fast.json", "w") as f:
-            f.write(json.dumps(pages_json))
+        return pages_json
+
+    job = CrawlJob(pages, "json/pages_fast.json", chunk_size=50, checkpoint_every=1)
+    job.run(fetch_chunk, verbose, restart)
 
 
 def get_pages_json(json_file: str) -> List[ManualPage]:
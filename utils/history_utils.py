@@ -0,0 +1,106 @@
+from typing import Any, Dict, List
+
+import numpy as np
+
+from actions.ARKWiki import ARKWiki
+from classes.CrawlJob import CrawlJob
+from utils.atomic_utils import atomic_write
+
+
+def create_history_npz(pages: List[str], wiki: ARKWiki, npz_file: str = "json/history.npz", content: bool = False, limit: int = 0, verbose: bool = False, restart: bool = False) -> None:
+    """Creates (or overwrites) a columnar .npz file of the revision history of every page in 'pages'
+
+    Each page's history is fetched with Query.get_revisions, and progress is checkpointed
+    to npz_file + ".checkpoint", so an interrupted run resumes where it left off,
+    and a finished run for the same page names and parameters is skipped.
+    See get_history_npz for the columns that are written.
+
+    Args:
+        pages (List[str]): a list of page names
+        wiki (ARKWiki): the ARKWiki object
+        npz_file (str): the name of the npz file (default: json/history.npz)
+        content (bool): whether to include the content of each revision (default: False)
+        limit (int): the number of most recent revisions to keep per page, 0 for all (default: 0)
+        verbose (bool): whether to print page names (default: False)
+        restart (bool): whether to ignore the checkpoint and fetch every page again (default: False)
+
+    Returns:
+        Nothing
+    """
+
+    def fetch_chunk(c: List[str]) -> Dict[str, Any]:
+        return {l: wiki.query.get_revisions(l, content, limit) for l in c}
+
+    def write_output(f: str, history: Dict[str, Any]) -> None:
+        write_history_npz(f, history, content)
+
+    job = CrawlJob(pages, npz_file, chunk_size=1, checkpoint_every=10, write_output=write_output, job_key={"content": content, "limit": limit})
+    job.run(fetch_chunk, verbose, restart)
+
+
+def write_history_npz(npz_file: str, history: Dict[str, List[Dict[str, Any]]], content: bool = False) -> None:
+    """Atomically writes revision history to a columnar .npz file
+
+    Args:
+        npz_file (str): the name of the npz file
+        history (Dict[str, List[Dict[str, Any]]]): a dict mapping a page name (key), to a list of revisions (value),
+            as returned by Query.get_revisions
+        content (bool): whether to write the content of each revision (default: False)
+
+    Returns:
+        Nothing
+    """
+
+    titles = list(history)
+    revisions = [r for l in titles for r in history[l]]
+
+    columns = {
+        "titles": np.array(titles, dtype=str),
+        "page_index": np.array([i for i, l in enumerate(titles) for _ in history[l]], dtype=np.int32),
+        "pageid": np.array([r["pageid"] for r in revisions], dtype=np.int64),
+        "revid": np.array([r["revid"] for r in revisions], dtype=np.int64),
+        "parentid": np.array([r["parentid"] for r in revisions], dtype=np.int64),
+        "timestamp": np.array([r["timestamp"].rstrip("Z") for r in revisions], dtype="datetime64[s]"),
+        "size": np.array([r["size"] for r in revisions], dtype=np.int64),
+        "user": np.array([r["user"] for r in revisions], dtype=str)
+    }
+
+    if content:
+        encoded = [r["content"].encode("utf-8") for r in revisions]
+        columns["content"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        columns["content_offsets"] = np.cumsum([0] + [len(e) for e in encoded], dtype=np.int64)
+
+    atomic_write(npz_file, "wb", lambda f: np.savez_compressed(f, **columns))
+
+
+def get_history_npz(npz_file: str) -> Dict[str, np.ndarray]:
+    """Loads revision history from a .npz file created by create_history_npz
+
+    Every revision column has one row per revision:
+    page_index (index into titles), pageid, revid, parentid, timestamp (datetime64[s]), size, user.
+    If content was fetched, the content of revision i is get_revision_content(history, i).
+
+    Args:
+        npz_file (str): the name of the npz file
+
+    Returns:
+        A dict mapping a column name (key), to a numpy array (value)
+    """
+
+    with np.load(npz_file) as data:
+        return {k: data[k] for k in data.files}
+
+
+def get_revision_content(history: Dict[str, np.ndarray], i: int) -> str:
+    """Decodes the content of a single revision from a dict returned by get_history_npz
+
+    Args:
+        history (Dict[str, np.ndarray]): the loaded revision history
+        i (int): the row of the revision
+
+    Returns:
+        The content of the revision
+    """
+
+    start, end = history["content_offsets"][i], history["content_offsets"][i + 1]
+    return history["content"][start:end].tobytes().decode("utf-8")